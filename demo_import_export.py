@@ -8,12 +8,13 @@ This demonstrates:
 3. Verifying that imported data maintains double-entry accounting principles
 """
 
+import argparse
 import sys
 from decimal import Decimal
 from datetime import date
 
 # Import the banking system
-exec(open('medici-banking.py').read())
+from medici_banking import Ledger, AccountType, TransactionEntry
 
 
 def demo_export():
@@ -142,12 +143,9 @@ def demo_historical_data():
     print(f"Total accounts created: {len(ledger.accounts)}")
     print(f"Total transactions: {len(ledger.transactions)}")
     
-    # Calculate total debits and credits
-    total_debits = Decimal('0')
-    total_credits = Decimal('0')
-    for transaction in ledger.transactions:
-        total_debits += sum(entry.amount for entry in transaction.debits)
-        total_credits += sum(entry.amount for entry in transaction.credits)
+    # Total debits and credits are kept up to date by the ledger
+    total_debits = ledger.total_debits
+    total_credits = ledger.total_credits
     
     print(f"\nTotal debits:  {total_debits.quantize(Decimal('0.01'))}")
     print(f"Total credits: {total_credits.quantize(Decimal('0.01'))}")
@@ -161,26 +159,47 @@ def demo_historical_data():
     return ledger
 
 
-def main():
+def parse_args(argv=None):
+    """Parse the command-line options for the demonstration"""
+    parser = argparse.ArgumentParser(
+        description="Demonstrate importing and exporting Medici Bank transactions."
+    )
+    parser.add_argument(
+        '--historical', action='store_true',
+        help="also import the 20,000 transaction historical dataset"
+    )
+    parser.add_argument(
+        '--skip-exports', action='store_true',
+        help="skip the export and re-import round-trip demos"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Run all demos"""
+    args = parse_args(argv)
+    
     print("\n" + "#"*70)
     print("# MEDICI BANK - IMPORT/EXPORT DEMONSTRATION")
     print("#"*70)
     
-    # Demo 1: Export transactions
-    export_ledger = demo_export()
-    
-    # Demo 2: Import from CSV
-    csv_ledger = demo_import_csv()
-    
-    # Demo 3: Import from JSON
-    json_ledger = demo_import_json()
+    if not args.skip_exports:
+        # Demo 1: Export transactions
+        export_ledger = demo_export()
+        
+        # Demo 2: Import from CSV
+        csv_ledger = demo_import_csv()
+        
+        # Demo 3: Import from JSON
+        json_ledger = demo_import_json()
     
     # Demo 4: Import historical data (optional)
-    print("\n" + "="*70)
-    response = input("Do you want to import the 20,000 historical transactions? (y/N): ")
-    if response.lower() in ['y', 'yes']:
+    if args.historical:
         historical_ledger = demo_historical_data()
+    else:
+        print("\n" + "="*70)
+        print("Skipping the 20,000 historical transactions "
+              "(run with --historical to import them).")
     
     print("\n" + "#"*70)
     print("# DEMONSTRATION COMPLETE")
@@ -10,13 +10,51 @@ from the Medici Bank's operations during 1390-1440, including:
 - Regular banking operations across branches
 """
 
+import argparse
 import csv
 import json
 import random
-from datetime import date, timedelta
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
 from decimal import Decimal
+from itertools import accumulate
+from operator import itemgetter
 from typing import List, Dict, Tuple
 
+def to_cents(amount: float) -> int:
+    """
+    Round a florin amount to whole cents
+    
+    Rounds the shortest decimal form of the float half-to-even, exactly as
+    Decimal(str(amount)).quantize(Decimal('0.01')) does, using int arithmetic.
+    """
+    text = repr(amount)
+    if 'e' in text or 'n' in text:
+        # Exponent notation, inf or nan: leave the edge cases to Decimal
+        return int(Decimal(text).quantize(Decimal('0.01')).scaleb(2))
+    
+    sign = 1
+    if text[0] == '-':
+        sign, text = -1, text[1:]
+    whole, _, fraction = text.partition('.')
+    cents = int(whole + fraction[:2].ljust(2, '0'))
+    remainder = fraction[2:].rstrip('0')
+    if remainder > '5' or (remainder == '5' and cents % 2):
+        cents += 1
+    return sign * cents
+
+
+# CSV columns in file order (alphabetical). Only loan repayments and bills of
+# exchange use the second credit leg.
+CSV_FIELDNAMES = (
+    "branch", "counterparty", "credit_account", "credit_account_2",
+    "credit_amount", "credit_amount_2", "currency", "date", "debit_account",
+    "debit_amount", "description", "id", "type"
+)
+
+
 # Historical context and transaction types
 class HistoricalPeriod:
     """Defines major historical periods and their characteristics"""
@@ -64,11 +102,30 @@ class HistoricalPeriod:
     }
 
 
+# The 35,000 florin ransom for Pope John XXIII, paid when he was deposed at
+# the Council of Constance (major historical event)
+CONSTANCE_RANSOM = {
+    "id": 0,
+    "date": date(1415, 5, 29).isoformat(),
+    "branch": "Constance",
+    "type": "ransom_payment",
+    "counterparty": "Council of Constance - Pope John XXIII Ransom",
+    "description": "Payment of 35,000 florin ransom for Pope John XXIII",
+    "debit_account": "Papal Receivable",
+    "debit_amount": 35000.0,
+    "credit_account": "Cash",
+    "credit_amount": 35000.0,
+    "currency": "florin"
+}
+
+
 class TransactionGenerator:
     """Generates historically-themed banking transactions"""
     
     def __init__(self, seed=42):
-        random.seed(seed)
+        # Private seeded generator, so runs are reproducible regardless of
+        # what else uses the module-level random functions
+        self.rng = random.Random(seed)
         self.transaction_id = 1
         self.branches = ["Florence", "Rome", "Venice", "Milan", "Geneva", "Bruges", "London", "Avignon"]
         self.currencies = ["florin", "ducat", "scudo", "lira"]
@@ -90,27 +147,44 @@ class TransactionGenerator:
             "Holy See", "Apostolic Chamber", "Sacred College"
         ]
         
+        # Deposit and withdrawal customers
+        self.customers = self.merchants + self.nobles
+        
+        # Destination branches for bills of exchange, keyed by source branch
+        self.other_branches = {
+            branch: [b for b in self.branches if b != branch]
+            for branch in self.branches
+        }
+        
+        # Per-branch account and counterparty names, built once so every row
+        # for a branch shares the same string instead of formatting its own
+        self.due_from = {branch: f"Due from {branch}" for branch in self.branches}
+        self.transfer_to = {branch: f"Transfer to {branch}" for branch in self.branches}
+        self.branch_operations = {
+            branch: f"{branch} Operations" for branch in self.branches
+        }
+        
     def random_date(self, start: date, end: date) -> date:
         """Generate a random date between start and end"""
-        delta = end - start
-        random_days = random.randint(0, delta.days)
-        return start + timedelta(days=random_days)
+        start_ordinal = start.toordinal()
+        random_days = self.rng.randint(0, end.toordinal() - start_ordinal)
+        return date.fromordinal(start_ordinal + random_days)
     
-    def random_amount(self, min_amount: int, max_amount: int) -> Decimal:
-        """Generate a random amount in florins"""
+    def random_amount(self, min_amount: int, max_amount: int) -> int:
+        """Generate a random amount in florins, returned as whole cents"""
         # Use exponential distribution to get realistic banking amounts
         # (most transactions small, some very large)
-        base = random.uniform(min_amount, max_amount)
-        factor = random.choice([1, 1, 1, 2, 5, 10, 20, 50])  # Weighted toward smaller multipliers
+        base = self.rng.uniform(min_amount, max_amount)
+        factor = self.rng.choice([1, 1, 1, 2, 5, 10, 20, 50])  # Weighted toward smaller multipliers
         amount = base * factor
-        # Use Decimal.quantize for precise decimal handling
-        return Decimal(str(amount)).quantize(Decimal('0.01'))
+        return to_cents(amount)
     
     def generate_papal_deposit(self, transaction_date: date) -> Dict:
         """Generate papal banking deposits (major income source)"""
         branch = "Rome"
-        entity = random.choice(self.papal_entities)
+        entity = self.rng.choice(self.papal_entities)
         amount = self.random_amount(500, 50000)  # Large deposits from papal sources
+        florins = amount / 100
         
         return {
             "id": self.transaction_id,
@@ -120,29 +194,27 @@ class TransactionGenerator:
             "counterparty": entity,
             "description": f"Deposit from {entity} to Rome branch",
             "debit_account": "Cash",
-            "debit_amount": float(amount),
+            "debit_amount": florins,
             "credit_account": "Deposits Payable",
-            "credit_amount": float(amount),
+            "credit_amount": florins,
             "currency": "florin"
         }
     
-    def generate_loan_issuance(self, transaction_date: date) -> List[Dict]:
+    def generate_loan_issuance(self, transaction_date: date) -> Dict:
         """Generate loan to merchant or noble"""
-        branch = random.choice(self.branches)
-        is_noble = random.random() > 0.7
-        counterparty = random.choice(self.nobles if is_noble else self.merchants)
+        branch = self.rng.choice(self.branches)
+        is_noble = self.rng.random() > 0.7
+        counterparty = self.rng.choice(self.nobles if is_noble else self.merchants)
         
         # Nobles get larger loans
         if is_noble:
             amount = self.random_amount(1000, 100000)
         else:
             amount = self.random_amount(100, 10000)
-        
-        transactions = []
+        florins = amount / 100
         
         # Loan disbursement
-        self.transaction_id += 1
-        transactions.append({
+        return {
             "id": self.transaction_id,
             "date": transaction_date.isoformat(),
             "branch": branch,
@@ -150,25 +222,25 @@ class TransactionGenerator:
             "counterparty": counterparty,
             "description": f"Loan issued to {counterparty} from {branch} branch",
             "debit_account": "Loans Receivable",
-            "debit_amount": float(amount),
+            "debit_amount": florins,
             "credit_account": "Cash",
-            "credit_amount": float(amount),
+            "credit_amount": florins,
             "currency": "florin"
-        })
-        
-        return transactions
+        }
     
     def generate_loan_repayment(self, transaction_date: date) -> Dict:
         """Generate loan repayment with interest"""
-        branch = random.choice(self.branches)
-        is_noble = random.random() > 0.7
-        counterparty = random.choice(self.nobles if is_noble else self.merchants)
+        branch = self.rng.choice(self.branches)
+        is_noble = self.rng.random() > 0.7
+        counterparty = self.rng.choice(self.nobles if is_noble else self.merchants)
         
         principal = self.random_amount(100, 10000)
-        # Generate interest rate as Decimal to avoid floating-point precision issues
-        interest_rate = Decimal(random.randint(8, 25)) / Decimal('100')  # 8-25% interest
+        # Interest rate in whole percent, kept as an int to avoid floating-point
+        # precision issues
+        interest_rate = self.rng.randint(8, 25)  # 8-25% interest
+        # Interest and total in ten-thousandths of a florin (cents x percent)
         interest = principal * interest_rate
-        total = principal + interest
+        total = principal * 100 + interest
         
         return {
             "id": self.transaction_id,
@@ -178,17 +250,18 @@ class TransactionGenerator:
             "counterparty": counterparty,
             "description": f"Loan repayment from {counterparty} with interest",
             "debit_account": "Cash",
-            "debit_amount": float(total),
+            "debit_amount": total / 10000,
             "credit_account": "Loans Receivable",
-            "credit_amount": float(principal),
+            "credit_amount": principal / 100,
             "credit_account_2": "Interest Income",
-            "credit_amount_2": float(interest),
+            "credit_amount_2": interest / 10000,
             "currency": "florin"
         }
     
     def generate_war_financing(self, transaction_date: date, war_type: str) -> Dict:
         """Generate war-related financing transactions"""
         amount = self.random_amount(5000, 200000)  # Wars are expensive
+        florins = amount / 100
         
         description_map = {
             "milan": f"War financing for Florentine operations against Milan",
@@ -204,39 +277,42 @@ class TransactionGenerator:
             "counterparty": "Republic of Florence",
             "description": description_map.get(war_type, "War financing"),
             "debit_account": "Loans Receivable - Government",
-            "debit_amount": float(amount),
+            "debit_amount": florins,
             "credit_account": "Cash",
-            "credit_amount": float(amount),
+            "credit_amount": florins,
             "currency": "florin"
         }
     
     def generate_alum_trade(self, transaction_date: date) -> Dict:
         """Generate alum trade transactions (papal monopoly)"""
-        branch = random.choice(["Rome", "Florence", "Venice"])
+        branch = self.rng.choice(["Rome", "Florence", "Venice"])
         amount = self.random_amount(200, 5000)
+        florins = amount / 100
         
         return {
             "id": self.transaction_id,
             "date": transaction_date.isoformat(),
             "branch": branch,
             "type": "alum_trade",
-            "counterparty": random.choice(self.merchants),
+            "counterparty": self.rng.choice(self.merchants),
             "description": f"Alum sale from papal mines",
             "debit_account": "Cash",
-            "debit_amount": float(amount),
+            "debit_amount": florins,
             "credit_account": "Trading Revenue",
-            "credit_amount": float(amount),
+            "credit_amount": florins,
             "currency": "florin"
         }
     
     def generate_bills_of_exchange(self, transaction_date: date) -> Dict:
         """Generate bills of exchange (international banking innovation)"""
-        from_branch = random.choice(self.branches)
-        to_branch = random.choice([b for b in self.branches if b != from_branch])
+        from_branch = self.rng.choice(self.branches)
+        to_branch = self.rng.choice(self.other_branches[from_branch])
         amount = self.random_amount(500, 20000)
         
-        # Small exchange fee (profit center) - use Decimal for precision
-        fee_rate = Decimal(random.randint(100, 300)) / Decimal('10000')  # 1-3% fee
+        # Small exchange fee (profit center) in basis points, kept as an int
+        # for precision
+        fee_rate = self.rng.randint(100, 300)  # 1-3% fee
+        # Fee in millionths of a florin (cents x basis points)
         fee = amount * fee_rate
         
         return {
@@ -244,20 +320,20 @@ class TransactionGenerator:
             "date": transaction_date.isoformat(),
             "branch": from_branch,
             "type": "bill_of_exchange",
-            "counterparty": f"Transfer to {to_branch}",
+            "counterparty": self.transfer_to[to_branch],
             "description": f"Bill of exchange from {from_branch} to {to_branch}",
-            "debit_account": f"Due from {to_branch}",
-            "debit_amount": float(amount),
+            "debit_account": self.due_from[to_branch],
+            "debit_amount": amount / 100,
             "credit_account": "Cash",
-            "credit_amount": float(amount - fee),
+            "credit_amount": (amount * 10000 - fee) / 1000000,
             "credit_account_2": "Exchange Fee Revenue",
-            "credit_amount_2": float(fee),
+            "credit_amount_2": fee / 1000000,
             "currency": "florin"
         }
     
     def generate_operating_expense(self, transaction_date: date) -> Dict:
         """Generate daily operating expenses"""
-        branch = random.choice(self.branches)
+        branch = self.rng.choice(self.branches)
         expense_types = [
             ("Wages", 100, 2000),
             ("Rent", 50, 500),
@@ -267,29 +343,31 @@ class TransactionGenerator:
             ("Maintenance", 30, 400)
         ]
         
-        expense_type, min_amt, max_amt = random.choice(expense_types)
+        expense_type, min_amt, max_amt = self.rng.choice(expense_types)
         amount = self.random_amount(min_amt, max_amt)
+        florins = amount / 100
         
         return {
             "id": self.transaction_id,
             "date": transaction_date.isoformat(),
             "branch": branch,
             "type": "operating_expense",
-            "counterparty": f"{branch} Operations",
+            "counterparty": self.branch_operations[branch],
             "description": f"{expense_type} expense for {branch} branch",
             "debit_account": expense_type,
-            "debit_amount": float(amount),
+            "debit_amount": florins,
             "credit_account": "Cash",
-            "credit_amount": float(amount),
+            "credit_amount": florins,
             "currency": "florin"
         }
     
     def generate_deposit_withdrawal(self, transaction_date: date) -> Dict:
         """Generate customer deposit or withdrawal"""
-        branch = random.choice(self.branches)
-        is_withdrawal = random.random() > 0.5
-        counterparty = random.choice(self.merchants + self.nobles)
+        branch = self.rng.choice(self.branches)
+        is_withdrawal = self.rng.random() > 0.5
+        counterparty = self.rng.choice(self.customers)
         amount = self.random_amount(100, 15000)
+        florins = amount / 100
         
         if is_withdrawal:
             return {
@@ -300,9 +378,9 @@ class TransactionGenerator:
                 "counterparty": counterparty,
                 "description": f"Withdrawal by {counterparty}",
                 "debit_account": "Deposits Payable",
-                "debit_amount": float(amount),
+                "debit_amount": florins,
                 "credit_account": "Cash",
-                "credit_amount": float(amount),
+                "credit_amount": florins,
                 "currency": "florin"
             }
         else:
@@ -314,37 +392,18 @@ class TransactionGenerator:
                 "counterparty": counterparty,
                 "description": f"Deposit by {counterparty}",
                 "debit_account": "Cash",
-                "debit_amount": float(amount),
+                "debit_amount": florins,
                 "credit_account": "Deposits Payable",
-                "credit_amount": float(amount),
+                "credit_amount": florins,
                 "currency": "florin"
             }
     
     def generate_constance_ransom(self) -> List[Dict]:
         """Generate the specific 35,000 florin ransom for Pope John XXIII"""
-        transactions = []
-        ransom_date = date(1415, 5, 29)  # John XXIII deposed
-        total_ransom = Decimal('35000.00')
-        
-        # The ransom payment (major historical event)
-        self.transaction_id += 1
-        transactions.append({
-            "id": self.transaction_id,
-            "date": ransom_date.isoformat(),
-            "branch": "Constance",
-            "type": "ransom_payment",
-            "counterparty": "Council of Constance - Pope John XXIII Ransom",
-            "description": "Payment of 35,000 florin ransom for Pope John XXIII",
-            "debit_account": "Papal Receivable",
-            "debit_amount": float(total_ransom),
-            "credit_account": "Cash",
-            "credit_amount": float(total_ransom),
-            "currency": "florin"
-        })
-        
-        return transactions
+        return [dict(CONSTANCE_RANSOM, id=self.transaction_id)]
     
-    def generate_transactions(self, num_transactions: int = 20000) -> List[Dict]:
+    def generate_transactions(self, num_transactions: int = 20000,
+                              include_ransom: bool = True) -> List[Dict]:
         """Generate the full set of historical transactions"""
         transactions = []
         
@@ -353,9 +412,9 @@ class TransactionGenerator:
         end_date = date(1440, 12, 31)
         
         # Special historical event: Council of Constance ransom
-        constance_transactions = self.generate_constance_ransom()
-        transactions.extend(constance_transactions)
-        self.transaction_id += 1
+        if include_ransom:
+            transactions.extend(self.generate_constance_ransom())
+            self.transaction_id += 1
         
         # Distribution of transaction types (percentages)
         transaction_weights = {
@@ -369,74 +428,81 @@ class TransactionGenerator:
             "operating_expense": 0.17    # 17% - Daily operations
         }
         
+        # Cumulative weights, so each row's type is a bisect on one uniform
+        # draw instead of a Python walk over the weights dict
+        transaction_types = list(transaction_weights)
+        cumulative_weights = list(accumulate(transaction_weights.values()))
+        
+        # Row generator for each transaction type, looked up once per row
+        # instead of walking an if/elif chain of string comparisons
+        generators = {
+            "papal_deposit": self.generate_papal_deposit,
+            "loan_issuance": self.generate_loan_issuance,
+            "loan_repayment": self.generate_loan_repayment,
+            "deposit_withdrawal": self.generate_deposit_withdrawal,
+            "bills_of_exchange": self.generate_bills_of_exchange,
+            "alum_trade": self.generate_alum_trade,
+            "war_financing": lambda trans_date: self.generate_war_financing(
+                trans_date, self.rng.choice(["milan", "venice", "defensive"])
+            ),
+            "operating_expense": self.generate_operating_expense
+        }
+        
+        # Period bounds checked for every row, unpacked once up front
+        boom_start = HistoricalPeriod.PAPAL_BANKING_BOOM["start"]
+        boom_end = HistoricalPeriod.PAPAL_BANKING_BOOM["end"]
+        war_periods = [
+            (period["start"], period["end"])
+            for period in (
+                HistoricalPeriod.FIRST_MILANESE_WAR,
+                HistoricalPeriod.SECOND_MILANESE_WAR,
+                HistoricalPeriod.LOMBARDY_WARS
+            )
+        ]
+        
+        # Every day in the simulation, so a row's date is one randint and an
+        # index (same draw as random_date) rather than date arithmetic
+        start_ordinal = start_date.toordinal()
+        span_days = end_date.toordinal() - start_ordinal
+        calendar = [date.fromordinal(start_ordinal + offset)
+                    for offset in range(span_days + 1)]
+        
+        # Bound methods for the draws made on every iteration
+        rand = self.rng.random
+        randint = self.rng.randint
+        
         # Generate remaining transactions
         while len(transactions) < num_transactions:
             # Random date in our historical period
-            trans_date = self.random_date(start_date, end_date)
+            trans_date = calendar[randint(0, span_days)]
             
             # Choose transaction type based on weights
-            rand = random.random()
-            cumulative = 0
-            trans_type = None
-            
-            for t_type, weight in transaction_weights.items():
-                cumulative += weight
-                if rand <= cumulative:
-                    trans_type = t_type
-                    break
+            type_index = bisect_left(cumulative_weights, rand())
+            if type_index < len(transaction_types):
+                trans_type = transaction_types[type_index]
+            else:
+                trans_type = None
             
             # Increase papal banking during boom period
-            if (HistoricalPeriod.PAPAL_BANKING_BOOM["start"] <= trans_date 
-                <= HistoricalPeriod.PAPAL_BANKING_BOOM["end"]):
-                if random.random() < 0.3:  # 30% chance to override with papal transaction
+            if boom_start <= trans_date <= boom_end:
+                if rand() < 0.3:  # 30% chance to override with papal transaction
                     trans_type = "papal_deposit"
             
             # Increase war financing during war periods
-            war_periods = [
-                HistoricalPeriod.FIRST_MILANESE_WAR,
-                HistoricalPeriod.SECOND_MILANESE_WAR,
-                HistoricalPeriod.LOMBARDY_WARS
-            ]
-            
-            in_war_period = any(period["start"] <= trans_date <= period["end"] 
-                               for period in war_periods)
-            if in_war_period and random.random() < 0.15:  # 15% chance during wars
+            in_war_period = any(start <= trans_date <= end
+                               for start, end in war_periods)
+            if in_war_period and rand() < 0.15:  # 15% chance during wars
                 trans_type = "war_financing"
             
             # Generate transaction based on type
-            try:
-                if trans_type == "papal_deposit":
-                    trans = self.generate_papal_deposit(trans_date)
-                elif trans_type == "loan_issuance":
-                    trans_list = self.generate_loan_issuance(trans_date)
-                    transactions.extend(trans_list)
-                    continue
-                elif trans_type == "loan_repayment":
-                    trans = self.generate_loan_repayment(trans_date)
-                elif trans_type == "deposit_withdrawal":
-                    trans = self.generate_deposit_withdrawal(trans_date)
-                elif trans_type == "bills_of_exchange":
-                    trans = self.generate_bills_of_exchange(trans_date)
-                elif trans_type == "alum_trade":
-                    trans = self.generate_alum_trade(trans_date)
-                elif trans_type == "war_financing":
-                    war_type = random.choice(["milan", "venice", "defensive"])
-                    trans = self.generate_war_financing(trans_date, war_type)
-                elif trans_type == "operating_expense":
-                    trans = self.generate_operating_expense(trans_date)
-                else:
-                    continue
-                
-                self.transaction_id += 1
-                transactions.append(trans)
-                
-            except (ValueError, KeyError) as e:
-                # Specific exceptions for transaction generation failures
-                print(f"Error generating {trans_type}: {e}")
+            generate = generators.get(trans_type)
+            if generate is None:
                 continue
+            transactions.append(generate(trans_date))
+            self.transaction_id += 1
         
         # Sort by date
-        transactions.sort(key=lambda x: x["date"])
+        transactions.sort(key=itemgetter("date"))
         
         # Renumber transactions sequentially
         for idx, trans in enumerate(transactions, 1):
@@ -445,23 +511,56 @@ class TransactionGenerator:
         return transactions[:num_transactions]
 
 
+def _generate_shard(seed: int, num_transactions: int, include_ransom: bool) -> List[Dict]:
+    """Generate one shard's rows with its own seeded generator"""
+    generator = TransactionGenerator(seed=seed)
+    return generator.generate_transactions(num_transactions, include_ransom)
+
+
+def generate_sharded(num_transactions: int = 20000, seed: int = 42,
+                     shards: int = 1) -> List[Dict]:
+    """
+    Generate transactions across several processes
+    
+    Shard i draws from its own generator seeded with seed + i, and only the
+    first shard includes the Constance ransom. The shards are merged, sorted
+    by date and renumbered. With one shard this is exactly
+    TransactionGenerator(seed).generate_transactions(num_transactions); any
+    other shard count produces a different (equally valid) dataset.
+    """
+    if shards <= 1:
+        return TransactionGenerator(seed=seed).generate_transactions(num_transactions)
+    
+    # Spread the rows as evenly as possible, remainder to the first shards
+    base, extra = divmod(num_transactions, shards)
+    sizes = [base + (shard < extra) for shard in range(shards)]
+    seeds = [seed + shard for shard in range(shards)]
+    ransom_flags = [shard == 0 for shard in range(shards)]
+    
+    with ProcessPoolExecutor(max_workers=shards) as executor:
+        parts = list(executor.map(_generate_shard, seeds, sizes, ransom_flags))
+    
+    transactions = [trans for part in parts for trans in part]
+    transactions.sort(key=itemgetter("date"))
+    for idx, trans in enumerate(transactions, 1):
+        trans["id"] = idx
+    return transactions
+
+
 def save_to_csv(transactions: List[Dict], filename: str):
     """Save transactions to CSV file"""
     if not transactions:
         print("No transactions to save")
         return
     
-    # Get all unique field names
-    fieldnames = set()
-    for trans in transactions:
-        fieldnames.update(trans.keys())
-    
-    fieldnames = sorted(list(fieldnames))
-    
     with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(transactions)
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_FIELDNAMES)
+        # Single-credit rows have no second credit leg; leave those cells empty
+        writer.writerows(
+            tuple(trans.get(name, '') for name in CSV_FIELDNAMES)
+            for trans in transactions
+        )
     
     print(f"Saved {len(transactions)} transactions to {filename}")
 
@@ -482,51 +581,63 @@ def print_summary(transactions: List[Dict]):
     
     print(f"\nTotal Transactions: {len(transactions)}")
     
-    # Count by type
-    type_counts = {}
+    # Type and branch counts, date range and volume in a single pass
+    type_counts = Counter()
+    branch_counts = Counter()
+    first_date = last_date = transactions[0]["date"]
+    total_volume = 0
     for trans in transactions:
-        t_type = trans.get("type", "unknown")
-        type_counts[t_type] = type_counts.get(t_type, 0) + 1
+        type_counts[trans.get("type", "unknown")] += 1
+        branch_counts[trans.get("branch", "unknown")] += 1
+        trans_date = trans["date"]
+        if trans_date < first_date:
+            first_date = trans_date
+        elif trans_date > last_date:
+            last_date = trans_date
+        total_volume += trans.get("debit_amount", 0)
     
     print("\nTransactions by Type:")
-    for t_type, count in sorted(type_counts.items(), key=lambda x: x[1], reverse=True):
+    for t_type, count in type_counts.most_common():
         percentage = (count / len(transactions)) * 100
         print(f"  {t_type:25s}: {count:5d} ({percentage:5.2f}%)")
     
-    # Count by branch
-    branch_counts = {}
-    for trans in transactions:
-        branch = trans.get("branch", "unknown")
-        branch_counts[branch] = branch_counts.get(branch, 0) + 1
-    
     print("\nTransactions by Branch:")
-    for branch, count in sorted(branch_counts.items(), key=lambda x: x[1], reverse=True):
+    for branch, count in branch_counts.most_common():
         percentage = (count / len(transactions)) * 100
         print(f"  {branch:15s}: {count:5d} ({percentage:5.2f}%)")
     
-    # Date range
-    dates = [trans["date"] for trans in transactions]
-    print(f"\nDate Range: {min(dates)} to {max(dates)}")
+    print(f"\nDate Range: {first_date} to {last_date}")
     
-    # Calculate total monetary volume
-    total_volume = sum(trans.get("debit_amount", 0) for trans in transactions)
+    # Total monetary volume
     print(f"\nTotal Transaction Volume: {total_volume:,.2f} florins")
     
     print("="*60)
 
 
-def main():
+def parse_args(argv=None):
+    """Parse the command-line options for the generator"""
+    parser = argparse.ArgumentParser(
+        description="Generate the Medici Bank historical transaction dataset."
+    )
+    parser.add_argument(
+        '--shards', type=int, default=1,
+        help="number of processes to generate rows in; any value other than "
+             "1 produces a different dataset (default: 1)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Main function to generate historical transaction data"""
+    args = parse_args(argv)
+    
     print("Generating Medici Bank Historical Transaction Data...")
     print("Based on events from 1390-1440")
     print()
     
-    # Create generator
-    generator = TransactionGenerator(seed=42)
-    
     # Generate 20,000 transactions
     num_transactions = 20000
-    transactions = generator.generate_transactions(num_transactions)
+    transactions = generate_sharded(num_transactions, seed=42, shards=args.shards)
     
     # Print summary
     print_summary(transactions)
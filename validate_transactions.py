@@ -6,203 +6,384 @@ double-entry accounting principles and can be loaded into the Medici ledger.
 """
 
 import csv
+import heapq
 import json
 from decimal import Decimal
 from datetime import datetime
 from collections import defaultdict
+from operator import itemgetter
+from typing import Optional
 
 
-def validate_csv_structure(filename: str) -> bool:
-    """Validate the CSV file structure"""
-    print(f"\n{'='*60}")
-    print(f"VALIDATING CSV FILE: {filename}")
-    print(f"{'='*60}\n")
-    
-    required_fields = {'id', 'date', 'branch', 'type', 'description', 
-                      'debit_account', 'debit_amount', 'credit_account', 'credit_amount'}
-    
-    try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            fieldnames = set(reader.fieldnames)
-            
-            # Check if all required fields are present
-            missing_fields = required_fields - fieldnames
-            if missing_fields:
-                print(f"❌ Missing required fields: {missing_fields}")
-                return False
+# Largest debit/credit difference tolerated for a single transaction
+BALANCE_TOLERANCE = Decimal('0.01')
+
+# Number of invalid transactions listed individually; the rest are counted
+MAX_REPORTED_ERRORS = 100
+
+REQUIRED_FIELDS = frozenset({'id', 'date', 'branch', 'type', 'description',
+                             'debit_account', 'debit_amount', 'credit_account', 'credit_amount'})
+
+
+def _column_getter(fieldnames, *names):
+    """Return an itemgetter pulling the named columns out of a csv.reader row.
+
+    Raises KeyError for the first column missing from the header, like a
+    DictReader row lookup would.
+    """
+    index = {name: i for i, name in enumerate(fieldnames)}
+    return itemgetter(*[index[name] for name in names])
+
+
+def _optional_field(row, index, name):
+    """Return the column at index, raising KeyError(name) if the header lacks it"""
+    if index is None:
+        raise KeyError(name)
+    return row[index]
+
+
+def _missing_column(error):
+    """Return a visit() that fails with error, for a file lacking a column"""
+    def visit(row):
+        raise error
+    return visit
+
+
+class CsvValidation:
+    """Row visitor for the CSV structure and balance checks"""
+
+    def __init__(self):
+        self.error = None
+        self.fieldnames = None
+        self.missing_fields = None
+        self.messages = []
+        self.transaction_count = 0
+        self.error_count = 0
+        self.total_debits = Decimal('0')
+        self.total_credits = Decimal('0')
+
+    def start(self, fieldnames):
+        self.fieldnames = set(fieldnames)
+        self.field_count = len(fieldnames)
+        self.missing_fields = REQUIRED_FIELDS - self.fieldnames
+        if self.missing_fields:
+            return
+        self.fields = _column_getter(fieldnames, 'date', 'debit_amount', 'credit_amount')
+        # The second credit leg is optional; absent columns read as empty
+        columns = {name: i for i, name in enumerate(fieldnames)}
+        self.i_credit_2 = columns.get('credit_amount_2')
+        self.i_account_2 = columns.get('credit_account_2')
+
+    def reject(self, message):
+        """Count an invalid transaction, keeping its message if under the cap"""
+        self.error_count += 1
+        if len(self.messages) < MAX_REPORTED_ERRORS:
+            self.messages.append(message)
+
+    def visit_malformed(self, row):
+        """Count a row with fewer fields than the header as invalid"""
+        if self.missing_fields:
+            return
+        self.transaction_count += 1
+        self.reject(f"Row {self.transaction_count}: expected {self.field_count} fields, "
+                    f"got {len(row)}")
+
+    def visit(self, row):
+        if self.missing_fields:
+            return
+        self.transaction_count += 1
+        idx = self.transaction_count
+        date, debit, credit = self.fields(row)
+        
+        # Validate date format
+        try:
+            datetime.fromisoformat(date)
+        except ValueError:
+            self.reject(f"Invalid date format in transaction {idx}: {date}")
+            return
+        
+        # Validate amounts
+        try:
+            debit_amt = Decimal(debit)
+            credit_amt = Decimal(credit)
             
-            print(f"✓ All required fields present")
-            print(f"  Total fields: {len(fieldnames)}")
-            print(f"  Fields: {', '.join(sorted(fieldnames))}\n")
+            # Check for additional credit account
+            i_credit_2 = self.i_credit_2
+            if i_credit_2 is not None and row[i_credit_2]:
+                if self.i_account_2 is None or not row[self.i_account_2]:
+                    self.reject(f"Missing credit_account_2 for transaction {idx} with credit_amount_2")
+                    return
+                credit_amt += Decimal(row[i_credit_2])
             
-            # Validate each transaction
-            transaction_count = 0
-            error_count = 0
-            total_debits = Decimal('0')
-            total_credits = Decimal('0')
+            self.total_debits += debit_amt
+            self.total_credits += credit_amt
             
-            for idx, row in enumerate(reader, 1):
-                transaction_count += 1
+            # Check if transaction is balanced
+            # Allow for small floating point differences
+            if abs(debit_amt - credit_amt) > BALANCE_TOLERANCE:
+                self.reject(f"Unbalanced transaction {idx}: "
+                            f"Debit={debit_amt}, Credit={credit_amt}")
                 
-                # Validate date format
+        except (ValueError, KeyError) as e:
+            self.reject(f"Invalid amounts in transaction {idx}: {e}")
+
+
+class DistributionStats:
+    """Row visitor collecting transaction counts by type, branch and year"""
+
+    def __init__(self):
+        self.error = None
+        self.by_type = defaultdict(int)
+        self.by_branch = defaultdict(int)
+        self.by_year = defaultdict(int)
+        # Running debit volume per type; its row count is in by_type
+        self.volume_by_type = defaultdict(float)
+
+    def start(self, fieldnames):
+        # An empty file has no header, and no rows to visit either
+        fieldnames = fieldnames or []
+        try:
+            self.fields = _column_getter(fieldnames, 'type', 'branch', 'date', 'debit_amount')
+        except KeyError as e:
+            self.visit = _missing_column(e)
+
+    def visit_malformed(self, row):
+        """Leave a row too short to read out of the statistics"""
+
+    def visit(self, row):
+        trans_type, branch, date, debit = self.fields(row)
+        year = date[:4]
+        amount = float(debit)
+        
+        self.by_type[trans_type] += 1
+        self.by_branch[branch] += 1
+        self.by_year[year] += 1
+        self.volume_by_type[trans_type] += amount
+
+
+class HistoricalEvents:
+    """Row visitor looking for the well-known events of the Medici era"""
+
+    def __init__(self):
+        self.error = None
+        self.ransom_lines = []
+        self.ransom_types = {}
+        self.events_found = {
+            'ransom': False,
+            'papal_deposits': 0,
+            'war_financing': 0,
+            'alum_trade': 0,
+            'bills_of_exchange': 0
+        }
+
+    def start(self, fieldnames):
+        # An empty file has no header, and no rows to visit either
+        fieldnames = fieldnames or []
+        try:
+            self.i_type = fieldnames.index('type')
+        except ValueError:
+            self.visit = _missing_column(KeyError('type'))
+        # The rest are optional: branch is only read from deposits and date
+        # and debit_amount from ransom rows, while description is searched
+        # in every row and reads as empty when absent
+        columns = {name: i for i, name in enumerate(fieldnames)}
+        self.i_branch = columns.get('branch')
+        self.i_date = columns.get('date')
+        self.i_debit = columns.get('debit_amount')
+        self.i_description = columns.get('description')
+
+    def visit_malformed(self, row):
+        """Leave a row too short to read out of the event search"""
+
+    def visit(self, row):
+        trans_type = row[self.i_type]
+        i_description = self.i_description
+        description = row[i_description] if i_description is not None else ''
+        events_found = self.events_found
+        
+        # Check for Council of Constance ransom. Whether a type name mentions
+        # a ransom is worked out once per distinct type, not once per row.
+        is_ransom = self.ransom_types.get(trans_type)
+        if is_ransom is None:
+            is_ransom = self.ransom_types[trans_type] = 'ransom' in trans_type.lower()
+        if is_ransom or 'John XXIII' in description:
+            events_found['ransom'] = True
+            # Report lines are built here, inside the guarded visit, so a
+            # missing column ends the check after the lines already made
+            lines = self.ransom_lines
+            lines.append(f"✓ Found Council of Constance Ransom:")
+            lines.append(f"  Date: {_optional_field(row, self.i_date, 'date')}")
+            lines.append(f"  Amount: {_optional_field(row, self.i_debit, 'debit_amount')} florins")
+            lines.append(f"  Description: {_optional_field(row, i_description, 'description')}\n")
+        
+        # Count major transaction types
+        if trans_type == 'deposit' and _optional_field(row, self.i_branch, 'branch') == 'Rome':
+            events_found['papal_deposits'] += 1
+        elif trans_type == 'war_financing':
+            events_found['war_financing'] += 1
+        elif trans_type == 'alum_trade':
+            events_found['alum_trade'] += 1
+        elif trans_type == 'bill_of_exchange':
+            events_found['bills_of_exchange'] += 1
+
+
+def scan_csv(filename: str, *visitors):
+    """Read the CSV file once, feeding every row to each of the visitors.
+
+    A visitor that raises is dropped from the rest of the pass and keeps the
+    exception in its ``error`` attribute, so the other checks still see every
+    row, just as when each of them read the file on its own. Rows with fewer
+    fields than the header go to visit_malformed() instead of visit(); extra
+    trailing fields are ignored, as DictReader did.
+    """
+    active = list(visitors)
+    try:
+        with open(filename, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            fieldnames = next(reader, None)
+            for visitor in visitors:
                 try:
-                    datetime.fromisoformat(row['date'])
-                except ValueError:
-                    print(f"❌ Invalid date format in transaction {idx}: {row['date']}")
-                    error_count += 1
+                    visitor.start(fieldnames)
+                except Exception as e:
+                    visitor.error = e
+            active = [v for v in visitors if v.error is None]
+            width = len(fieldnames) if fieldnames is not None else 0
+            
+            for row in reader:
+                if not row:
+                    # Blank line, skipped as DictReader does
                     continue
-                
-                # Validate amounts
-                try:
-                    debit_amt = Decimal(str(row['debit_amount']))
-                    credit_amt = Decimal(str(row['credit_amount']))
-                    
-                    # Check for additional credit account
-                    if row.get('credit_amount_2'):
-                        if not row.get('credit_account_2'):
-                            print(f"❌ Missing credit_account_2 for transaction {idx} with credit_amount_2")
-                            error_count += 1
-                            continue
-                        credit_amt += Decimal(str(row['credit_amount_2']))
-                    
-                    total_debits += debit_amt
-                    total_credits += credit_amt
-                    
-                    # Check if transaction is balanced
-                    # Allow for small floating point differences
-                    if abs(debit_amt - credit_amt) > Decimal('0.01'):
-                        print(f"❌ Unbalanced transaction {idx}: "
-                              f"Debit={debit_amt}, Credit={credit_amt}")
-                        error_count += 1
-                        
-                except (ValueError, KeyError) as e:
-                    print(f"❌ Invalid amounts in transaction {idx}: {e}")
-                    error_count += 1
+                if len(row) < width:
+                    for visitor in active:
+                        visitor.visit_malformed(row)
                     continue
-            
-            print(f"\nValidation Results:")
-            print(f"  Total transactions: {transaction_count}")
-            print(f"  Errors found: {error_count}")
-            print(f"  Total debits:  {total_debits:,.2f} florins")
-            print(f"  Total credits: {total_credits:,.2f} florins")
-            print(f"  Difference:    {abs(total_debits - total_credits):,.2f} florins")
-            
-            if error_count == 0:
-                print(f"\n✓ All transactions are valid!")
-                return True
-            else:
-                print(f"\n❌ Found {error_count} errors")
-                return False
-                
-    except FileNotFoundError:
-        print(f"❌ File not found: {filename}")
-        return False
+                failed = False
+                for visitor in active:
+                    try:
+                        visitor.visit(row)
+                    except Exception as e:
+                        visitor.error = e
+                        failed = True
+                if failed:
+                    active = [v for v in active if v.error is None]
     except Exception as e:
-        print(f"❌ Error reading file: {e}")
+        for visitor in active:
+            visitor.error = e
+    return visitors
+
+
+def validate_csv_structure(filename: str, validation: Optional[CsvValidation] = None) -> bool:
+    """Validate the CSV file structure"""
+    print(f"\n{'='*60}")
+    print(f"VALIDATING CSV FILE: {filename}")
+    print(f"{'='*60}\n")
+    
+    if validation is None:
+        validation, = scan_csv(filename, CsvValidation())
+    
+    if validation.fieldnames is not None:
+        # Check if all required fields are present
+        if validation.missing_fields:
+            print(f"❌ Missing required fields: {set(validation.missing_fields)}")
+            return False
+        
+        fieldnames = validation.fieldnames
+        print(f"✓ All required fields present")
+        print(f"  Total fields: {len(fieldnames)}")
+        print(f"  Fields: {', '.join(sorted(fieldnames))}\n")
+        
+        if validation.messages:
+            print('\n'.join(f"❌ {message}" for message in validation.messages))
+            unlisted = validation.error_count - len(validation.messages)
+            if unlisted:
+                print(f"  ... and {unlisted} more invalid transactions")
+    
+    if validation.error is not None:
+        if isinstance(validation.error, FileNotFoundError):
+            print(f"❌ File not found: {filename}")
+        else:
+            print(f"❌ Error reading file: {validation.error}")
+        return False
+    
+    total_debits = validation.total_debits
+    total_credits = validation.total_credits
+    error_count = validation.error_count
+    print(f"\nValidation Results:")
+    print(f"  Total transactions: {validation.transaction_count}")
+    print(f"  Errors found: {error_count}")
+    print(f"  Total debits:  {total_debits:,.2f} florins")
+    print(f"  Total credits: {total_credits:,.2f} florins")
+    print(f"  Difference:    {abs(total_debits - total_credits):,.2f} florins")
+    
+    if error_count == 0:
+        print(f"\n✓ All transactions are valid!")
+        return True
+    else:
+        print(f"\n❌ Found {error_count} errors")
         return False
 
 
-def analyze_transaction_distribution(filename: str):
+def analyze_transaction_distribution(filename: str, stats: Optional[DistributionStats] = None):
     """Analyze the distribution of transactions"""
     print(f"\n{'='*60}")
     print(f"TRANSACTION DISTRIBUTION ANALYSIS")
     print(f"{'='*60}\n")
     
-    try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            # Collect statistics
-            by_type = defaultdict(int)
-            by_branch = defaultdict(int)
-            by_year = defaultdict(int)
-            amounts_by_type = defaultdict(list)
-            
-            for row in reader:
-                trans_type = row['type']
-                branch = row['branch']
-                year = row['date'][:4]
-                amount = float(row['debit_amount'])
-                
-                by_type[trans_type] += 1
-                by_branch[branch] += 1
-                by_year[year] += 1
-                amounts_by_type[trans_type].append(amount)
-            
-            # Print by type
-            print("Transactions by Type:")
-            for t_type, count in sorted(by_type.items(), key=lambda x: x[1], reverse=True):
-                avg_amount = sum(amounts_by_type[t_type]) / len(amounts_by_type[t_type])
-                print(f"  {t_type:25s}: {count:5d} (avg: {avg_amount:>12,.2f} florins)")
-            
-            # Print by branch
-            print("\nTransactions by Branch:")
-            for branch, count in sorted(by_branch.items(), key=lambda x: x[1], reverse=True):
-                print(f"  {branch:15s}: {count:5d}")
-            
-            # Print by year (sample)
-            print("\nTransactions by Year (sample):")
-            years_sample = sorted(by_year.items())[:10]
-            for year, count in years_sample:
-                print(f"  {year}: {count:5d}")
-            print(f"  ... ({len(by_year)} total years)")
-            
-    except Exception as e:
-        print(f"❌ Error analyzing distribution: {e}")
+    if stats is None:
+        stats, = scan_csv(filename, DistributionStats())
+    if stats.error is not None:
+        print(f"❌ Error analyzing distribution: {stats.error}")
+        return
+    
+    by_type = stats.by_type
+    by_branch = stats.by_branch
+    by_year = stats.by_year
+    volume_by_type = stats.volume_by_type
+    
+    # Print by type
+    print("Transactions by Type:")
+    for t_type, count in sorted(by_type.items(), key=lambda x: x[1], reverse=True):
+        avg_amount = volume_by_type[t_type] / count
+        print(f"  {t_type:25s}: {count:5d} (avg: {avg_amount:>12,.2f} florins)")
+    
+    # Print by branch
+    print("\nTransactions by Branch:")
+    for branch, count in sorted(by_branch.items(), key=lambda x: x[1], reverse=True):
+        print(f"  {branch:15s}: {count:5d}")
+    
+    # Print by year (sample)
+    print("\nTransactions by Year (sample):")
+    years_sample = heapq.nsmallest(10, by_year.items())
+    for year, count in years_sample:
+        print(f"  {year}: {count:5d}")
+    print(f"  ... ({len(by_year)} total years)")
 
 
-def check_historical_events(filename: str):
+def check_historical_events(filename: str, events: Optional[HistoricalEvents] = None):
     """Check for specific historical events in the data"""
     print(f"\n{'='*60}")
     print(f"HISTORICAL EVENT VERIFICATION")
     print(f"{'='*60}\n")
     
-    try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            events_found = {
-                'ransom': False,
-                'papal_deposits': 0,
-                'war_financing': 0,
-                'alum_trade': 0,
-                'bills_of_exchange': 0
-            }
-            
-            for row in reader:
-                trans_type = row['type']
-                
-                # Check for Council of Constance ransom
-                if 'ransom' in trans_type.lower() or 'John XXIII' in row.get('description', ''):
-                    events_found['ransom'] = True
-                    print(f"✓ Found Council of Constance Ransom:")
-                    print(f"  Date: {row['date']}")
-                    print(f"  Amount: {row['debit_amount']} florins")
-                    print(f"  Description: {row['description']}\n")
-                
-                # Count major transaction types
-                if trans_type == 'deposit' and row['branch'] == 'Rome':
-                    events_found['papal_deposits'] += 1
-                elif trans_type == 'war_financing':
-                    events_found['war_financing'] += 1
-                elif trans_type == 'alum_trade':
-                    events_found['alum_trade'] += 1
-                elif trans_type == 'bill_of_exchange':
-                    events_found['bills_of_exchange'] += 1
-            
-            print("Historical Event Coverage:")
-            print(f"  {'Council of Constance Ransom:':<35} {'✓ Found' if events_found['ransom'] else '❌ Missing'}")
-            print(f"  {'Papal deposits (Rome branch):':<35} {events_found['papal_deposits']:>6} transactions")
-            print(f"  {'War financing operations:':<35} {events_found['war_financing']:>6} transactions")
-            print(f"  {'Alum trade (papal monopoly):':<35} {events_found['alum_trade']:>6} transactions")
-            print(f"  {'Bills of exchange (innovation):':<35} {events_found['bills_of_exchange']:>6} transactions")
-            
-            return events_found
-            
-    except Exception as e:
-        print(f"❌ Error checking historical events: {e}")
+    if events is None:
+        events, = scan_csv(filename, HistoricalEvents())
+    
+    for line in events.ransom_lines:
+        print(line)
+    
+    if events.error is not None:
+        print(f"❌ Error checking historical events: {events.error}")
         return None
+    
+    events_found = events.events_found
+    print("Historical Event Coverage:")
+    print(f"  {'Council of Constance Ransom:':<35} {'✓ Found' if events_found['ransom'] else '❌ Missing'}")
+    print(f"  {'Papal deposits (Rome branch):':<35} {events_found['papal_deposits']:>6} transactions")
+    print(f"  {'War financing operations:':<35} {events_found['war_financing']:>6} transactions")
+    print(f"  {'Alum trade (papal monopoly):':<35} {events_found['alum_trade']:>6} transactions")
+    print(f"  {'Bills of exchange (innovation):':<35} {events_found['bills_of_exchange']:>6} transactions")
+    
+    return events_found
 
 
 def validate_json_structure(filename: str) -> bool:
@@ -246,17 +427,21 @@ def main():
     print("MEDICI BANK TRANSACTION DATA VALIDATION")
     print("="*60)
     
+    # Read the CSV once for the structure check, distribution and events
+    validation, stats, events = scan_csv('medici_transactions.csv', CsvValidation(),
+                                         DistributionStats(), HistoricalEvents())
+    
     # Validate CSV
-    csv_valid = validate_csv_structure('medici_transactions.csv')
+    csv_valid = validate_csv_structure('medici_transactions.csv', validation)
     
     # Validate JSON
     json_valid = validate_json_structure('medici_transactions.json')
     
     # Analyze distribution
-    analyze_transaction_distribution('medici_transactions.csv')
+    analyze_transaction_distribution('medici_transactions.csv', stats)
     
     # Check historical events
-    check_historical_events('medici_transactions.csv')
+    check_historical_events('medici_transactions.csv', events)
     
     # Final summary
     print(f"\n{'='*60}")